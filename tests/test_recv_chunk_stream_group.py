@@ -15,6 +15,7 @@
 
 import collections.abc
 import ctypes
+import functools
 import gc
 import threading
 import time
@@ -67,6 +68,95 @@ place_bias_llc = scipy.LowLevelCallable(
 )
 
 
+@pytest.fixture(scope="module")
+def thread_pool():
+    """Worker thread pool shared by the sequence tests' streams.
+
+    Those streams never receive any data, so they need not make forward
+    progress independently and a single shared pool is safe. Streams that
+    do flow data must use :func:`stream_thread_pool` instead.
+    """
+    pool = spead2.ThreadPool(STREAMS)
+    yield pool
+    pool.stop()
+
+
+@functools.lru_cache
+def stream_thread_pool(index):
+    """Get a single-threaded pool dedicated to the stream at position `index`.
+
+    Grouped streams deadlock unless each can make forward progress
+    independently (see the caveats in the chunk stream group documentation),
+    so they cannot share a pool; caching per stream index still avoids
+    spinning up fresh OS threads for every test.
+    """
+    return spead2.ThreadPool()
+
+
+@functools.lru_cache
+def free_chunk_buffers(capacity):
+    """Get backing buffers for the chunks placed on the free ring.
+
+    Allocating and zero-filling the chunk payloads dominates fixture setup
+    time, so the buffers are allocated once and shared across tests. The
+    Chunk wrappers themselves are recreated per test: putting a chunk on a
+    ringbuffer transfers ownership of its buffers, so a Chunk cannot simply
+    be reused once it has been handed over.
+    """
+    # The payload is deliberately left uninitialised: the receiver writes it
+    # before the chunk is emitted, and _verify only reads the portions whose
+    # heaps are marked present. Only `present` needs to start zeroed.
+    return [
+        (np.zeros(HEAPS_PER_CHUNK, np.uint8), np.empty(CHUNK_PAYLOAD_SIZE, np.uint8))
+        for _ in range(capacity)
+    ]
+
+
+_ARENAS = {}
+
+
+def arena(size, dtype):
+    """Get a reusable scratch array of the given size and dtype.
+
+    The contents are whatever the previous user left behind, so callers must
+    initialise anything they read. Tests run one at a time, so handing out
+    the same array repeatedly is safe.
+    """
+    key = (size, np.dtype(dtype))
+    array = _ARENAS.get(key)
+    if array is None:
+        array = np.empty(size, dtype)
+        _ARENAS[key] = array
+    return array
+
+
+@functools.lru_cache
+def make_item_group(payload_size):
+    """Get the canonical item group used to build the test heaps.
+
+    add_item walks the descriptor machinery, so build the group once and
+    share it; callers only update the item values between get_heap calls.
+    """
+    ig = spead2.send.ItemGroup()
+    ig.add_item(0x1000, "position", "position in stream", (), format=[("u", 32)])
+    ig.add_item(0x1001, "payload", "payload data", (payload_size,), dtype=np.uint8)
+    return ig
+
+
+@functools.lru_cache
+def make_data(chunks):
+    """Get random payload for `chunks` chunks' worth of heaps.
+
+    The tests only read the data, and generating several megabytes of random
+    bytes is slow, so the result is cached across tests (including the
+    eviction_mode parametrisations) and marked read-only.
+    """
+    rng = np.random.default_rng(seed=1)
+    data = rng.integers(0, 256, chunks * CHUNK_PAYLOAD_SIZE, np.uint8)
+    data.setflags(write=False)
+    return data
+
+
 class TestChunkStreamGroupConfig:
     def test_default_construct(self):
         config = recv.ChunkStreamGroupConfig()
@@ -94,55 +184,69 @@ class TestChunkStreamGroupConfig:
 class TestChunkStreamRingGroupSequence:
     """Test that ChunkStreamRingGroup behaves like a sequence."""
 
-    def make_group(self, n_streams):
-        group = spead2.recv.ChunkStreamRingGroup(
-            spead2.recv.ChunkStreamGroupConfig(),
-            spead2.recv.ChunkRingbuffer(4),
-            spead2.recv.ChunkRingbuffer(4),
-        )
-        streams = []
-        for _ in range(n_streams):
-            streams.append(
-                group.emplace_back(
-                    spead2.ThreadPool(),
-                    spead2.recv.StreamConfig(),
-                    spead2.recv.ChunkStreamConfig(place=place_plain_llc),
-                )
+    _group_cache = {}
+
+    @pytest.fixture
+    def make_group(self, thread_pool):
+        def make(n_streams, cached=True):
+            # These tests never flow data or mutate the group, so groups can
+            # be shared between tests that want the same size. Pass
+            # cached=False where a private group is required (e.g. to test
+            # garbage collection).
+            if cached and n_streams in self._group_cache:
+                return self._group_cache[n_streams]
+            group = spead2.recv.ChunkStreamRingGroup(
+                spead2.recv.ChunkStreamGroupConfig(),
+                spead2.recv.ChunkRingbuffer(4),
+                spead2.recv.ChunkRingbuffer(4),
             )
-        return group, streams
+            streams = []
+            for _ in range(n_streams):
+                streams.append(
+                    group.emplace_back(
+                        thread_pool,
+                        spead2.recv.StreamConfig(),
+                        spead2.recv.ChunkStreamConfig(place=place_plain_llc),
+                    )
+                )
+            if cached:
+                self._group_cache[n_streams] = (group, streams)
+            return group, streams
+
+        return make
 
-    def test_len(self):
-        group, _ = self.make_group(5)
+    def test_len(self, make_group):
+        group, _ = make_group(5)
         assert len(group) == 5
 
-    def test_getitem_simple(self):
-        group, streams = self.make_group(3)
+    def test_getitem_simple(self, make_group):
+        group, streams = make_group(3)
         assert group[0] is streams[0]
         assert group[1] is streams[1]
         assert group[2] is streams[2]
 
-    def test_getitem_wrap(self):
-        group, streams = self.make_group(3)
+    def test_getitem_wrap(self, make_group):
+        group, streams = make_group(3)
         assert group[-1] is streams[-1]
         assert group[-2] is streams[-2]
         assert group[-3] is streams[-3]
 
-    def test_getitem_bad(self):
-        group, streams = self.make_group(3)
+    def test_getitem_bad(self, make_group):
+        group, streams = make_group(3)
         with pytest.raises(IndexError):
             group[3]
         with pytest.raises(IndexError):
             group[-4]
 
-    def test_getitem_slice(self):
-        group, streams = self.make_group(5)
+    def test_getitem_slice(self, make_group):
+        group, streams = make_group(5)
         assert group[1:3] == streams[1:3]
         assert group[4:0:-2] == streams[4:0:-2]
         assert group[1:-1:2] == streams[1:-1:2]
 
-    def test_getitem_slice_gc(self):
+    def test_getitem_slice_gc(self, make_group):
         """Test that the streams returned by getitem keep the group alive."""
-        group = self.make_group(5)[0]
+        group = make_group(5, cached=False)[0]
         group_weak = weakref.ref(group)
         streams = group[1:3]
         del group
@@ -156,28 +260,28 @@ class TestChunkStreamRingGroupSequence:
             gc.collect()
         assert group_weak() is None
 
-    def test_iter(self):
-        group, streams = self.make_group(5)
+    def test_iter(self, make_group):
+        group, streams = make_group(5)
         assert list(group) == streams
 
-    def test_reversed(self):
-        group, streams = self.make_group(5)
+    def test_reversed(self, make_group):
+        group, streams = make_group(5)
         assert list(reversed(group)) == list(reversed(streams))
 
-    def test_contains(self):
-        group, streams = self.make_group(2)
+    def test_contains(self, make_group):
+        group, streams = make_group(2)
         assert streams[0] in group
         assert streams[1] in group
         assert None not in group
 
-    def test_count(self):
-        group, streams = self.make_group(2)
+    def test_count(self, make_group):
+        group, streams = make_group(2)
         assert group.count(streams[0]) == 1
         assert group.count(streams[1]) == 1
         assert group.count(group) == 0
 
-    def test_index(self):
-        group, streams = self.make_group(2)
+    def test_index(self, make_group):
+        group, streams = make_group(2)
         assert group.index(streams[0]) == 0
         assert group.index(streams[1]) == 1
         assert group.index(streams[1], 1, 2) == 1
@@ -191,24 +295,28 @@ class TestChunkStreamRingGroupSequence:
 
 
 class TestChunkStreamRingGroup:
+    # Ringbuffer capacity. A power of two comfortably above the 20 chunks the
+    # tests flow, so that the receive side never stalls waiting for _verify
+    # to return chunks (with only 4 slots the producer and consumer proceed
+    # in lock-step).
+    RING_SIZE = 32
+
     @pytest.fixture
     def data_ring(self):
-        return spead2.recv.ChunkRingbuffer(4)
+        return spead2.recv.ChunkRingbuffer(self.RING_SIZE)
 
     @pytest.fixture
     def free_ring(self):
-        ring = spead2.recv.ChunkRingbuffer(4)
-        while not ring.full():
-            ring.put(
-                recv.Chunk(
-                    present=np.zeros(HEAPS_PER_CHUNK, np.uint8),
-                    data=np.zeros(CHUNK_PAYLOAD_SIZE, np.uint8),
-                )
-            )
+        ring = spead2.recv.ChunkRingbuffer(self.RING_SIZE)
+        for present, data in free_chunk_buffers(ring.maxsize):
+            present[:] = 0
+            ring.put(recv.Chunk(present=present, data=data))
         return ring
 
     @pytest.fixture
     def queues(self):
+        # InprocQueue is unbounded, so the senders in these tests can never
+        # block on a full queue, no matter how many heaps are in flight.
         return [spead2.InprocQueue() for _ in range(STREAMS)]
 
     @pytest.fixture(params=[LOSSY_PARAM, LOSSLESS_PARAM])
@@ -235,9 +343,9 @@ class TestChunkStreamRingGroup:
             max_chunks=4,
             place=place_llc,
         )
-        for queue in queues:
+        for i in range(len(queues)):
             group.emplace_back(
-                spead2.ThreadPool(), config=config, chunk_stream_config=chunk_stream_config
+                stream_thread_pool(i), config=config, chunk_stream_config=chunk_stream_config
             )
         for stream, queue in zip(group, queues):
             stream.add_inproc_reader(queue)
@@ -246,29 +354,51 @@ class TestChunkStreamRingGroup:
 
     @pytest.fixture
     def send_stream(self, queues):
-        return send.InprocStream(spead2.ThreadPool(), queues, send.StreamConfig())
-
-    def _send_data(self, send_stream, data, eviction_mode, heaps=None):
-        """Send the data.
-
-        To send only a subset of heaps (or to send out of order), pass the
-        indices to skip in `heaps`.
+        # max_heaps must be large enough for a whole test's worth of heaps
+        # to be submitted to send_heaps in a single call.
+        return send.InprocStream(spead2.ThreadPool(), queues, send.StreamConfig(max_heaps=512))
+
+    def _make_heap_refs(self, data_by_heap, heaps):
+        """Build the heaps for the given heap indices.
+
+        `data_by_heap` is the payload reshaped to one row per heap. To send
+        only a subset of heaps (or to send out of order), pass the indices in
+        `heaps`. The heaps reference the payload data rather than copying it,
+        so the result can be reused across several sends without
+        re-serialising anything.
         """
-        lossy = eviction_mode == recv.ChunkStreamGroupConfig.EvictionMode.LOSSY
-        data_by_heap = data.reshape(-1, HEAP_PAYLOAD_SIZE)
-        ig = spead2.send.ItemGroup()
-        ig.add_item(0x1000, "position", "position in stream", (), format=[("u", 32)])
-        ig.add_item(0x1001, "payload", "payload data", (HEAP_PAYLOAD_SIZE,), dtype=np.uint8)
-        # In lossy mode the behaviour is inherently non-deterministic.
-        # We just feed the data in slowly enough that we expect heaps provided
-        # before a sleep to be processed before those after the sleep.
+        # Slice up the data once: each element is a zero-copy view of one
+        # heap's payload, saving a fresh view object per loop iteration.
+        payload_views = list(data_by_heap)
+        ig = make_item_group(HEAP_PAYLOAD_SIZE)
+        heap_refs = []
         for i in heaps:
             ig["position"].value = i
-            ig["payload"].value = data_by_heap[i]
+            ig["payload"].value = payload_views[i]
             heap = ig.get_heap(data="all", descriptors="none")
-            send_stream.send_heap(heap, substream_index=i % STREAMS)
-            if lossy:
+            heap_refs.append(send.HeapReference(heap, substream_index=i % STREAMS))
+        return heap_refs
+
+    def _send_data(self, send_stream, heap_refs, eviction_mode):
+        """Send pre-built heaps (see :meth:`_make_heap_refs`)."""
+        lossy = eviction_mode == recv.ChunkStreamGroupConfig.EvictionMode.LOSSY
+        if lossy:
+            # In lossy mode the behaviour is inherently non-deterministic.
+            # We just feed the data in slowly enough that we expect heaps
+            # provided before a sleep to be processed before those after the
+            # sleep. Pacing in small batches rather than per heap amortises
+            # the sleeps; a batch spans well under the max_chunks window, so
+            # the streams cannot drift far enough apart to evict a chunk
+            # that is still receiving data.
+            batch_size = 16
+            for start in range(0, len(heap_refs), batch_size):
+                batch = heap_refs[start : start + batch_size]
+                send_stream.send_heaps(batch, send.GroupMode.SERIAL)
                 time.sleep(0.003)
+        else:
+            # Submit everything in one call, avoiding a Python -> C++
+            # round trip per heap.
+            send_stream.send_heaps(heap_refs, send.GroupMode.SERIAL)
 
     def _verify(self, group, data, expected_present, chunk_id_bias=0):
         expected_present = expected_present.reshape(-1, HEAPS_PER_CHUNK)
@@ -276,10 +406,26 @@ class TestChunkStreamRingGroup:
         chunks = len(expected_present)
         data_by_heap = data.reshape(chunks, HEAPS_PER_CHUNK, -1)
 
+        pending = collections.deque()
+
+        def get_chunk():
+            # Opportunistically drain the ringbuffer, so that a batch of
+            # ready chunks costs one blocking get rather than one each. A
+            # Stopped here just means the ring was stopped behind the chunks
+            # we already hold; the blocking get reports it at the right time.
+            if not pending:
+                pending.append(group.data_ringbuffer.get())
+                try:
+                    while True:
+                        pending.append(group.data_ringbuffer.get_nowait())
+                except (spead2.Empty, spead2.Stopped):
+                    pass
+            return pending.popleft()
+
         def next_real_chunk():
             # Skip padding chunks
             while True:
-                chunk = group.data_ringbuffer.get()
+                chunk = get_chunk()
                 if any(chunk.present):
                     return chunk
                 else:
@@ -288,37 +434,52 @@ class TestChunkStreamRingGroup:
         for i in expected_chunk_ids:
             chunk = next_real_chunk()
             assert chunk.chunk_id == i + chunk_id_bias
-            np.testing.assert_equal(chunk.present, expected_present[i])
+            # np.array_equal rather than np.testing.assert_equal: the latter
+            # goes through the diagnostic machinery even when the arrays
+            # match, which is most of the cost of the happy path.
+            assert np.array_equal(chunk.present, expected_present[i]), f"chunk {i} present"
             actual_data = chunk.data.reshape(HEAPS_PER_CHUNK, -1)
-            for j in range(HEAPS_PER_CHUNK):
-                if expected_present[i, j]:
-                    np.testing.assert_equal(actual_data[j], data_by_heap[i, j])
+            # Compare all the present heaps in one shot rather than once per
+            # heap; the absent heaps hold uninitialised data.
+            mask = expected_present[i].astype(bool)
+            assert np.array_equal(actual_data[mask], data_by_heap[i, mask]), f"chunk {i} payload"
             group.add_free_chunk(chunk)
 
         # Stopping all the queues should shut down the data ringbuffer
+        assert not pending
         with pytest.raises(spead2.Stopped):
             group.data_ringbuffer.get()
 
     def _test_simple(self, group, send_stream, chunks, heaps, chunk_id_bias=0):
         """Send a given set of heaps (in order) and check that they arrive correctly."""
-        rng = np.random.default_rng(seed=1)
-        data = rng.integers(0, 256, chunks * CHUNK_PAYLOAD_SIZE, np.uint8)
+        data = make_data(chunks)
+        heap_refs = self._make_heap_refs(data.reshape(-1, HEAP_PAYLOAD_SIZE), heaps)
 
         def send():
-            self._send_data(send_stream, data, group.config.eviction_mode, heaps)
+            self._send_data(send_stream, heap_refs, group.config.eviction_mode)
             # Stop all the queues, which should flush everything and stop the
             # data ring.
             for queue in send_stream.queues:
                 queue.stop()
 
-        send_thread = threading.Thread(target=send)
-        send_thread.start()
-
-        expected_present = np.zeros(chunks * HEAPS_PER_CHUNK, np.uint8)
+        if group.config.eviction_mode == recv.ChunkStreamGroupConfig.EvictionMode.LOSSY:
+            # The paced sends must overlap with chunk consumption, so they
+            # need their own thread.
+            send_thread = threading.Thread(target=send)
+            send_thread.start()
+        else:
+            # The inproc queues are unbounded, so sending cannot block and
+            # there is no need for a separate thread.
+            send()
+            send_thread = None
+
+        expected_present = arena(chunks * HEAPS_PER_CHUNK, np.uint8)
+        expected_present[:] = 0
         expected_present[heaps] = True
         self._verify(group, data, expected_present, chunk_id_bias)
 
-        send_thread.join()
+        if send_thread is not None:
+            send_thread.join()
 
     def test_full_in_order(self, group, send_stream):
         """Send all the data, in order."""
@@ -329,52 +490,53 @@ class TestChunkStreamRingGroup:
     def test_missing_stream(self, group, send_stream):
         """Skip sending data to one of the streams."""
         chunks = 20
-        heaps = [i for i in range(chunks * HEAPS_PER_CHUNK) if i % STREAMS != 2]
+        all_heaps = np.arange(chunks * HEAPS_PER_CHUNK)
+        heaps = all_heaps[all_heaps % STREAMS != 2].tolist()
         self._test_simple(group, send_stream, chunks, heaps)
 
     def test_half_missing_stream(self, group, send_stream):
         """Skip sending data to one of the streams after a certain point."""
         chunks = 20
-        heaps = [
-            i
-            for i in range(chunks * HEAPS_PER_CHUNK)
-            if i < 7 * HEAPS_PER_CHUNK or i % STREAMS != 2
-        ]
+        all_heaps = np.arange(chunks * HEAPS_PER_CHUNK)
+        heaps = all_heaps[(all_heaps < 7 * HEAPS_PER_CHUNK) | (all_heaps % STREAMS != 2)].tolist()
         self._test_simple(group, send_stream, chunks, heaps)
 
     def test_missing_chunks(self, group, send_stream):
         """Skip sending some whole chunks."""
         chunks = 20
         skip = [1, 6, 7, 13, 14, 15, 16, 17, 18]
-        heaps = [i for i in range(chunks * HEAPS_PER_CHUNK) if i // HEAPS_PER_CHUNK not in skip]
+        all_heaps = np.arange(chunks * HEAPS_PER_CHUNK)
+        heaps = all_heaps[~np.isin(all_heaps // HEAPS_PER_CHUNK, skip)].tolist()
         self._test_simple(group, send_stream, chunks, heaps)
 
     @pytest.mark.parametrize("eviction_mode", [LOSSLESS_PARAM])
     def test_lossless_late_stream(self, group, send_stream):
         """Send one stream later than the others, to make sure lossless mode really works."""
         chunks = 20
-        rng = np.random.default_rng(seed=1)
-        data = rng.integers(0, 256, chunks * CHUNK_PAYLOAD_SIZE, np.uint8)
-        heaps1 = [i for i in range(chunks * HEAPS_PER_CHUNK) if i % STREAMS != 2]
-        heaps2 = [i for i in range(chunks * HEAPS_PER_CHUNK) if i % STREAMS == 2]
-
-        def send():
-            self._send_data(send_stream, data, group.config.eviction_mode, heaps1)
-            time.sleep(0.01)
-            self._send_data(send_stream, data, group.config.eviction_mode, heaps2)
-            # Stop all the queues, which should flush everything and stop the
-            # data ring.
-            for queue in send_stream.queues:
-                queue.stop()
-
-        send_thread = threading.Thread(target=send)
-        send_thread.start()
-
-        expected_present = np.ones(chunks * HEAPS_PER_CHUNK, np.uint8)
+        data = make_data(chunks)
+        all_heaps = np.arange(chunks * HEAPS_PER_CHUNK)
+        late = all_heaps % STREAMS == 2
+        heaps1 = all_heaps[~late].tolist()
+        heaps2 = all_heaps[late].tolist()
+        data_by_heap = data.reshape(-1, HEAP_PAYLOAD_SIZE)
+        heap_refs1 = self._make_heap_refs(data_by_heap, heaps1)
+        heap_refs2 = self._make_heap_refs(data_by_heap, heaps2)
+
+        # Sending to the unbounded inproc queues cannot block, so there is no
+        # need for a separate sending thread. send_heaps is synchronous, so
+        # the first batch is fully submitted before the late stream's batch
+        # starts; no sleep is needed to separate them.
+        self._send_data(send_stream, heap_refs1, group.config.eviction_mode)
+        self._send_data(send_stream, heap_refs2, group.config.eviction_mode)
+        # Stop all the queues, which should flush everything and stop the
+        # data ring.
+        for queue in send_stream.queues:
+            queue.stop()
+
+        expected_present = arena(chunks * HEAPS_PER_CHUNK, np.uint8)
+        expected_present[:] = 1
         self._verify(group, data, expected_present)
 
-        send_thread.join()
-
     def test_large_chunk_ids(self, group, send_stream, chunk_id_bias):
         chunks = 20
         heaps = list(range(chunks * HEAPS_PER_CHUNK))
@@ -387,11 +549,14 @@ class TestChunkStreamRingGroup:
         chunks = 20
         # Leave one stream half-missing, to really jam things up
         n_heaps = chunks * HEAPS_PER_CHUNK
-        heaps = [i for i in range(n_heaps) if i < n_heaps // 2 or i % STREAMS != 2]
-        rng = np.random.default_rng(seed=1)
-        data = rng.integers(0, 256, chunks * CHUNK_PAYLOAD_SIZE, np.uint8)
-
-        self._send_data(send_stream, data, group.config.eviction_mode, heaps)
+        all_heaps = np.arange(n_heaps)
+        heaps = all_heaps[(all_heaps < n_heaps // 2) | (all_heaps % STREAMS != 2)].tolist()
+        # The payload content is never verified by this test, so there is no
+        # need for random data.
+        data = np.zeros(chunks * CHUNK_PAYLOAD_SIZE, np.uint8)
+
+        heap_refs = self._make_heap_refs(data.reshape(-1, HEAP_PAYLOAD_SIZE), heaps)
+        self._send_data(send_stream, heap_refs, group.config.eviction_mode)
         time.sleep(0.01)  # Give it time to consume some of the data
         group.stop()
 